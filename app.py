@@ -1,12 +1,20 @@
 import os
+import json
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
+import polars as pl
 import dash
-from dash import dcc, html, Input, Output, callback
+from dash import dcc, html, Input, Output, callback, Patch
+from flask_caching import Cache
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 
+# Serialize figures with orjson, which encodes NumPy arrays at C speed
+pio.json.config.default_engine = 'orjson'
+
 # Initialize Dash app
 app = dash.Dash(__name__)
 app.title = "Análisis de Polio: Cobertura de Vacunación y Casos"
@@ -14,93 +22,132 @@ app.title = "Análisis de Polio: Cobertura de Vacunación y Casos"
 # For deployment
 server = app.server
 
+# Figure cache on disk so it is shared across Gunicorn workers
+cache = Cache(server, config={
+    'CACHE_TYPE': 'FileSystemCache',
+    'CACHE_DIR': os.path.join('data', 'cache', 'figures'),
+    'CACHE_DEFAULT_TIMEOUT': 0
+})
+
+# Cache location for the prepared frames (skips CSV parsing on warm starts)
+CACHE_DIR = os.path.join("data", "cache")
+INCOME_TIME_CACHE = os.path.join(CACHE_DIR, "income_time.feather")
+POLIO_VACCINE_CACHE = os.path.join(CACHE_DIR, "polio_vaccine.feather")
+
 # Load and prepare data
 def load_and_prepare_data():
-    """Load and prepare all datasets for the dashboard"""
-    
-    # Load datasets
-    df_polio = pd.read_csv("data/number-of-estimated-paralytic-polio-cases-by-world-region.csv")
-    df_metadata = pd.read_csv("data/country_metadata.csv")
-    df_pop = pd.read_csv('data/total_population.csv')
-    df_vaccine = pd.read_csv('data/global-vaccination-coverage.csv')
-    
-    # Prepare metadata
-    df_metadata.rename(columns={'Country Code': 'Code'}, inplace=True)
-    
-    # Prepare population data
-    df_pop.rename(columns={'Country Code': 'Code'}, inplace=True)
-    year_columns = [col for col in df_pop.columns if col.isdigit()]
-    df_pop_long = pd.melt(
-        df_pop, 
-        id_vars=['Country Name', 'Code', 'Indicator Name', 'Indicator Code'],
-        value_vars=year_columns,
-        var_name='year',
-        value_name='total_pop'
-    )
-    df_pop_long['year'] = df_pop_long['year'].astype(int)
-    df_pop_subset = df_pop_long[['Code', 'year', 'total_pop']]
-    df_metadata_subset = df_metadata[['Code', 'Region', 'IncomeGroup']]
-    
-    # Prepare main polio dataset
-    df_polio_clean = df_polio.copy()
-    df_polio_clean.rename(columns={
+    """Prepare all datasets with Polars' lazy engine, returning pandas frames"""
+
+    # Scan the Parquet datasets lazily so Polars can plan the whole
+    # pipeline at once (regenerate them with scripts/convert_to_parquet.py)
+    polio = pl.scan_parquet("data/polio_cases.parquet").rename({
         'Entity': 'country',
         'Code': 'code',
         'Year': 'year',
         'Estimated number of paralytic polio cases using reported number of cases after polio free certification (WHO, 2018 and Tebbens et al., 2011)': 'num_cases'
-    }, inplace=True)
-    
-    # Merge with metadata and population
-    df_polio_clean = pd.merge(df_polio_clean, df_metadata[['Code', 'Region', 'IncomeGroup']], left_on='code', right_on='Code', how='left')
-    df_polio_clean.drop('Code', axis=1, inplace=True)
-    df_polio_clean.rename(columns={'Region': 'region', 'IncomeGroup': 'income_group'}, inplace=True)
-    
-    df_polio_clean = pd.merge(df_polio_clean, df_pop_subset, left_on=['code', 'year'], right_on=['Code', 'year'], how='left')
-    df_polio_clean.drop('Code', axis=1, inplace=True)
-    
-    # Calculate cases per million
-    df_polio_clean['cases_per_million'] = (df_polio_clean['num_cases'] / df_polio_clean['total_pop']) * 1000000
-    
-    # Prepare income group aggregation
-    aggregations = {
-        'cases_per_million': 'mean',
-        'num_cases': 'sum',
-        'total_pop': 'sum'
-    }
-    df_income_time = df_polio_clean.dropna(subset=['income_group']).groupby(['income_group', 'year']).agg(aggregations).reset_index()
-    df_income_time['income_cases_per_million'] = (df_income_time['num_cases'] / df_income_time['total_pop']) * 1000000
-    
-    # Prepare vaccine data
-    df_vaccine_subset = df_vaccine[['Entity', 'Year', 'Pol3 (% of one-year-olds immunized)']].copy()
-    df_vaccine_subset.rename(columns={
-        'Entity': 'country',
-        'Year': 'year',
-        'Pol3 (% of one-year-olds immunized)': 'pol3_immunization_rate'
-    }, inplace=True)
-    
-    # Merge polio and vaccine data
-    df_polio_vaccine = pd.merge(df_polio_clean, df_vaccine_subset, on=['country', 'year'], how='left')
-    
-    # Fill missing vaccination data with country means
-    country_means = df_polio_vaccine.groupby('country')['pol3_immunization_rate'].mean()
-    for country in df_polio_vaccine['country'].unique():
-        country_mask = df_polio_vaccine['country'] == country
-        country_nulls = df_polio_vaccine.loc[country_mask, 'pol3_immunization_rate'].isnull()
-        
-        if country_nulls.any() and country in country_means and not pd.isna(country_means[country]):
-            df_polio_vaccine.loc[country_mask & country_nulls, 'pol3_immunization_rate'] = country_means[country]
-    
+    }).with_columns(
+        pl.col('year').cast(pl.Int16),
+        pl.col('num_cases').cast(pl.Float32)
+    )
+
+    metadata = pl.scan_parquet("data/country_metadata.parquet").select(
+        pl.col('Country Code').alias('code'),
+        pl.col('Region').alias('region'),
+        pl.col('IncomeGroup').alias('income_group')
+    )
+
+    # Reshape population wide-to-long, keeping only the key column
+    pop = pl.scan_parquet('data/total_population.parquet').rename({'Country Code': 'code'})
+    year_columns = [col for col in pop.collect_schema().names() if col.isdigit()]
+    pop = pop.select(['code'] + year_columns).unpivot(
+        index='code', variable_name='year', value_name='total_pop'
+    ).drop_nulls('total_pop').with_columns(pl.col('year').cast(pl.Int16))
+
+    vaccine = pl.scan_parquet('data/vaccination_coverage.parquet').select(
+        pl.col('Entity').alias('country'),
+        pl.col('Year').cast(pl.Int16).alias('year'),
+        pl.col('Pol3 (% of one-year-olds immunized)').cast(pl.Float32).alias('pol3_immunization_rate')
+    )
+
+    # Join metadata and population, then derive cases per million
+    polio_clean = (
+        polio
+        .join(metadata, on='code', how='left')
+        .join(pop, on=['code', 'year'], how='left')
+        .with_columns(
+            ((pl.col('num_cases') / pl.col('total_pop')) * 1000000).cast(pl.Float32).alias('cases_per_million')
+        )
+    )
+
+    # Income group aggregation (projected down to the key and aggregated
+    # columns so the groupby's working set stays minimal)
+    income_time = (
+        polio_clean
+        .drop_nulls('income_group')
+        .select('income_group', 'year', 'cases_per_million', 'num_cases', 'total_pop')
+        .group_by('income_group', 'year')
+        .agg(
+            pl.col('cases_per_million').mean(),
+            pl.col('num_cases').sum(),
+            pl.col('total_pop').sum()
+        )
+        .with_columns(
+            ((pl.col('num_cases') / pl.col('total_pop')) * 1000000).alias('income_cases_per_million')
+        )
+        .sort('income_group', 'year')
+    )
+
+    # Merge vaccine data and fill missing rates with country means. Only
+    # rows with a 3-letter ISO code are kept: the aggregate entities
+    # (regions, income groups, world) never reach the map anyway
+    polio_vaccine = (
+        polio_clean
+        .filter(pl.col('code').str.len_chars() == 3)
+        .join(vaccine, on=['country', 'year'], how='left')
+        .with_columns(
+            pl.col('pol3_immunization_rate').fill_null(
+                pl.col('pol3_immunization_rate').mean().over('country')
+            )
+        )
+    )
+
+    df_income_time, df_polio_vaccine = pl.collect_all([income_time, polio_vaccine])
+    df_income_time = df_income_time.to_pandas()
+    df_polio_vaccine = df_polio_vaccine.to_pandas()
+
+    # Low-cardinality string columns become categoricals so downstream
+    # groupbys hash small integer codes instead of Python strings
+    for col in ('country', 'code', 'region', 'income_group'):
+        df_polio_vaccine[col] = df_polio_vaccine[col].astype('category')
+
+    return df_income_time, df_polio_vaccine
+
+def load_data():
+    """Load the prepared frames from the Feather cache, building it on first run"""
+
+    if os.path.exists(INCOME_TIME_CACHE) and os.path.exists(POLIO_VACCINE_CACHE):
+        return pd.read_feather(INCOME_TIME_CACHE), pd.read_feather(POLIO_VACCINE_CACHE)
+
+    df_income_time, df_polio_vaccine = load_and_prepare_data()
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    df_income_time.to_feather(INCOME_TIME_CACHE, compression='lz4')
+    df_polio_vaccine.to_feather(POLIO_VACCINE_CACHE, compression='lz4')
+
     return df_income_time, df_polio_vaccine
 
 # Load data
-df_income_time, df_polio_vaccine = load_and_prepare_data()
+df_income_time, df_polio_vaccine = load_data()
 
 def create_stacked_area_chart(df_income_time):
     """Create the stacked area chart for income groups over time"""
     
-    # Prepare data for stacked area plot
-    df_stacked = df_income_time.pivot(index='year', columns='income_group', values='income_cases_per_million')
-    df_stacked = df_stacked.fillna(0)
+    # Prepare data for stacked area plot (the data is already aggregated per
+    # (year, income_group), so a plain unstack beats pivot's duplicate checks)
+    df_stacked = (
+        df_income_time.set_index(['year', 'income_group'])['income_cases_per_million']
+        .unstack('income_group', fill_value=0.0)
+    )
     
     # Create figure
     fig_stacked_area = go.Figure()
@@ -180,19 +227,19 @@ def create_stacked_area_chart(df_income_time):
     
     return fig_stacked_area
 
-def create_vaccination_map(df_polio_vaccine):
-    """Create the animated choropleth map with scatter overlay"""
-    
-    # Prepare data for animation
+def prepare_map_data(df_polio_vaccine):
+    """Aggregate the map data and extract per-period trace arrays"""
+
+    # Prepare data for the period slider (codes are already filtered to
+    # 3-letter ISO entries at load time)
     df_combined = df_polio_vaccine.dropna(subset=['pol3_immunization_rate', 'cases_per_million', 'code']).copy()
-    df_combined = df_combined[df_combined['code'].str.len() == 3]
     
     # Create 3-year periods
     df_combined['year_group'] = ((df_combined['year'] - 1980) // 3) * 3 + 1980
     df_combined['period_label'] = df_combined['year_group'].astype(str) + '-' + (df_combined['year_group'] + 2).astype(str)
     
     # Group by country and period
-    df_combined_grouped = df_combined.groupby(['country', 'code', 'year_group', 'period_label', 'income_group']).agg({
+    df_combined_grouped = df_combined.groupby(['country', 'code', 'year_group', 'period_label', 'income_group'], observed=True).agg({
         'pol3_immunization_rate': 'mean',
         'cases_per_million': 'mean',
         'total_pop': 'mean'
@@ -200,28 +247,20 @@ def create_vaccination_map(df_polio_vaccine):
     
     df_combined_grouped = df_combined_grouped.sort_values('year_group').reset_index(drop=True)
     
-    # Create vaccination categories
-    def get_vaccination_category(coverage):
-        if coverage >= 95:
-            return "Muy Alta (≥95%)"
-        elif coverage >= 85:
-            return "Alta (85-94%)"
-        elif coverage >= 70:
-            return "Media (70-84%)"
-        elif coverage >= 50:
-            return "Baja (50-69%)"
-        else:
-            return "Muy Baja (<50%)"
-    
-    df_combined_grouped['vaccination_category'] = df_combined_grouped['pol3_immunization_rate'].apply(get_vaccination_category)
+    # Create vaccination categories in one vectorized binning pass
+    df_combined_grouped['vaccination_category'] = pd.cut(
+        df_combined_grouped['pol3_immunization_rate'],
+        bins=[-np.inf, 50, 70, 85, 95, np.inf],
+        labels=["Muy Baja (<50%)", "Baja (50-69%)", "Media (70-84%)", "Alta (85-94%)", "Muy Alta (≥95%)"],
+        right=False
+    )
     
-    # Create bubble sizes
+    # Create bubble sizes in one fused float32 pass (zero-case countries
+    # keep their fixed size of 3)
+    cases = df_combined_grouped['cases_per_million'].to_numpy(np.float32, copy=False)
     df_combined_grouped['bubble_size'] = np.where(
-        df_combined_grouped['cases_per_million'] > 0,
-        np.sqrt(df_combined_grouped['cases_per_million']) * 8 + 5,
-        3
+        cases > 0, np.minimum(np.sqrt(cases) * 8 + 5, 40), 3
     )
-    df_combined_grouped['bubble_size'] = np.clip(df_combined_grouped['bubble_size'], 3, 40)
     
     # Country coordinates (simplified set)
     country_coords = {
@@ -245,13 +284,11 @@ def create_vaccination_map(df_polio_vaccine):
         'Yemen': [15.6, 48.0], 'Zambia': [-13.1, 27.8]
     }
     
-    # Add coordinates
-    df_combined_grouped['lat'] = df_combined_grouped['country'].map(
-        lambda x: country_coords.get(x, [None, None])[0]
-    )
-    df_combined_grouped['lon'] = df_combined_grouped['country'].map(
-        lambda x: country_coords.get(x, [None, None])[1]
-    )
+    # Add coordinates (plain dict maps stay on pandas' C lookup path)
+    lat_map = {country: coords[0] for country, coords in country_coords.items()}
+    lon_map = {country: coords[1] for country, coords in country_coords.items()}
+    df_combined_grouped['lat'] = df_combined_grouped['country'].map(lat_map)
+    df_combined_grouped['lon'] = df_combined_grouped['country'].map(lon_map)
     
     # Filter countries with valid coordinates
     df_scatter_overlay = df_combined_grouped[
@@ -260,105 +297,95 @@ def create_vaccination_map(df_polio_vaccine):
         (df_combined_grouped['cases_per_million'] >= 0)
     ].copy()
     
-    # Create figure
-    fig_vaccination_map = go.Figure()
-    
-    # Add initial choropleth
-    first_period = sorted(df_combined_grouped['period_label'].unique())[0]
-    first_period_data = df_combined_grouped[df_combined_grouped['period_label'] == first_period]
-    
-    fig_vaccination_map.add_trace(
-        go.Choropleth(
-            locations=first_period_data['code'],
-            z=first_period_data['pol3_immunization_rate'],
-            text=first_period_data['vaccination_category'],
-            customdata=first_period_data['country'],
-            colorscale=[[0, '#D32F2F'], [0.25, '#FF7043'], [0.5, '#FDD835'], 
-                       [0.75, '#66BB6A'], [1, '#2E7D32']],
-            zmin=0,
-            zmax=100,
-            showscale=False,
-            hovertemplate='<b>%{customdata}</b><br>' +
-                          'Cobertura: %{z:.1f}%<br>' +
-                          'Categoría: %{text}<br>' +
-                          '<extra></extra>',
-            name='Cobertura Vacunación',
-            showlegend=False
-        )
+    # Sort once and index both frames by period so each slice is a
+    # contiguous range read instead of a groupby materialization
+    df_combined_grouped = df_combined_grouped.sort_values('period_label').set_index('period_label', drop=False)
+    df_scatter_overlay = df_scatter_overlay.sort_values('period_label').set_index('period_label', drop=False)
+    periods = df_combined_grouped.index.unique().sort_values().tolist()
+    scatter_periods = set(df_scatter_overlay.index)
+
+    def build_payload(period):
+        grp = df_combined_grouped.loc[[period]]
+        payload = {
+            'choropleth': {
+                'locations': grp['code'].to_numpy(),
+                'z': grp['pol3_immunization_rate'].to_numpy(dtype=np.float32),
+                'text': grp['vaccination_category'].to_numpy(),
+                'customdata': grp['country'].to_numpy()
+            }
+        }
+
+        if period in scatter_periods:
+            scatter = df_scatter_overlay.loc[[period]]
+            payload['scatter'] = {
+                'lon': scatter['lon'].to_numpy(),
+                'lat': scatter['lat'].to_numpy(),
+                'size': scatter['bubble_size'].to_numpy(dtype=np.float32),
+                'hovertext': scatter['country'].to_numpy(),
+                'customdata': scatter['cases_per_million'].to_numpy(dtype=np.float32).round(2)
+            }
+        else:
+            payload['scatter'] = {'lon': [], 'lat': [], 'size': [], 'hovertext': [], 'customdata': []}
+
+        return payload
+
+    # Periods are independent, so extract their payloads in parallel (the
+    # NumPy conversions release the GIL)
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        payloads = dict(zip(periods, executor.map(build_payload, periods)))
+
+    return periods, payloads
+
+def make_choropleth(choro):
+    """Build the coverage choropleth from a period's trace arrays"""
+    return go.Choropleth(
+        locations=choro['locations'],
+        z=choro['z'],
+        text=choro['text'],
+        customdata=choro['customdata'],
+        colorscale=[[0, '#D32F2F'], [0.25, '#FF7043'], [0.5, '#FDD835'],
+                   [0.75, '#66BB6A'], [1, '#2E7D32']],
+        zmin=0,
+        zmax=100,
+        showscale=False,
+        hovertemplate='<b>%{customdata}</b><br>' +
+                      'Cobertura: %{z:.1f}%<br>' +
+                      'Categoría: %{text}<br>' +
+                      '<extra></extra>',
+        name='Cobertura Vacunación',
+        showlegend=False
     )
-    
-    # Add initial scatter
-    first_scatter_data = df_scatter_overlay[df_scatter_overlay['period_label'] == first_period]
-    if len(first_scatter_data) > 0:
-        fig_vaccination_map.add_trace(
-            go.Scattergeo(
-                lon=first_scatter_data['lon'],
-                lat=first_scatter_data['lat'],
-                mode='markers',
-                marker=dict(
-                    size=first_scatter_data['bubble_size'],
-                    color='rgba(139, 0, 0, 0.8)',
-                    line=dict(width=2, color='white'),
-                    symbol='circle'
-                ),
-                hovertext=first_scatter_data['country'],
-                customdata=first_scatter_data['cases_per_million'].round(2),
-                hovertemplate='<b>%{hovertext}</b><br>' +
-                              'Casos por millón: %{customdata}<br>' +
-                              '<extra></extra>',
-                name='Casos de Polio (por millón)',
-                showlegend=False
-            )
-        )
-    
-    # Create animation frames
-    frames = []
-    for period in sorted(df_combined_grouped['period_label'].unique()):
-        period_choropleth = df_combined_grouped[df_combined_grouped['period_label'] == period]
-        period_scatter = df_scatter_overlay[df_scatter_overlay['period_label'] == period]
-        
-        frame_data = [
-            go.Choropleth(
-                locations=period_choropleth['code'],
-                z=period_choropleth['pol3_immunization_rate'],
-                text=period_choropleth['vaccination_category'],
-                customdata=period_choropleth['country'],
-                colorscale=[[0, '#D32F2F'], [0.25, '#FF7043'], [0.5, '#FDD835'], 
-                           [0.75, '#66BB6A'], [1, '#2E7D32']],
-                zmin=0,
-                zmax=100,
-                showscale=False,
-                hovertemplate='<b>%{customdata}</b><br>' +
-                              'Cobertura: %{z:.1f}%<br>' +
-                              'Categoría: %{text}<br>' +
-                              '<extra></extra>'
-            )
-        ]
-        
-        if len(period_scatter) > 0:
-            frame_data.append(
-                go.Scattergeo(
-                    lon=period_scatter['lon'],
-                    lat=period_scatter['lat'],
-                    mode='markers',
-                    marker=dict(
-                        size=period_scatter['bubble_size'],
-                        color='rgba(139, 0, 0, 0.8)',
-                        line=dict(width=2, color='white'),
-                        symbol='circle'
-                    ),
-                    hovertext=period_scatter['country'],
-                    customdata=period_scatter['cases_per_million'].round(2),
-                    hovertemplate='<b>%{hovertext}</b><br>' +
-                                  'Casos por millón: %{customdata}<br>' +
-                                  '<extra></extra>'
-                )
-            )
-        
-        frames.append(go.Frame(data=frame_data, name=period))
-    
-    fig_vaccination_map.frames = frames
-    
+
+def make_scatter(scatter):
+    """Build the cases scatter overlay from a period's trace arrays"""
+    return go.Scattergeo(
+        lon=scatter['lon'],
+        lat=scatter['lat'],
+        mode='markers',
+        marker=dict(
+            size=scatter['size'],
+            color='rgba(139, 0, 0, 0.8)',
+            line=dict(width=2, color='white'),
+            symbol='circle'
+        ),
+        hovertext=scatter['hovertext'],
+        customdata=scatter['customdata'],
+        hovertemplate='<b>%{hovertext}</b><br>' +
+                      'Casos por millón: %{customdata}<br>' +
+                      '<extra></extra>',
+        name='Casos de Polio (por millón)',
+        showlegend=False
+    )
+
+def create_vaccination_map(first_payload):
+    """Create the base choropleth map showing the first period"""
+
+    # Create figure with both traces; the period slider callback patches
+    # their arrays in place, so the scatter is added even when empty
+    fig_vaccination_map = go.Figure()
+    fig_vaccination_map.add_trace(make_choropleth(first_payload['choropleth']))
+    fig_vaccination_map.add_trace(make_scatter(first_payload['scatter']))
+
     # Create custom legend annotations
     MAP_LEFT, MAP_RIGHT = 0.15, 0.85
     LEGEND_OFFSET = 0.02
@@ -429,77 +456,32 @@ def create_vaccination_map(df_polio_vaccine):
             x=0.5, y=0.95, font=dict(size=18)
         ),
         margin=dict(l=120, r=120, t=120, b=120),
-        annotations=annotations,
-        # Animation controls
-        updatemenus=[
-            dict(
-                type="buttons",
-                direction="left",
-                buttons=[
-                    dict(
-                        args=[None, {"frame": {"duration": 2000, "redraw": True},
-                                    "fromcurrent": True,
-                                    "transition": {"duration": 500, "easing": "cubic-in-out"},
-                                    "mode": "immediate"}],
-                        label="▶ Start",
-                        method="animate"
-                    ),
-                    dict(
-                        args=[[None], {"frame": {"duration": 0, "redraw": False},
-                                      "mode": "immediate",
-                                      "transition": {"duration": 0}}],
-                        label="⏸ Stop",
-                        method="animate"
-                    )
-                ],
-                pad={"r": 10, "t": 10},
-                showactive=False,
-                x=0.01,
-                xanchor="left",
-                y=0.05,
-                yanchor="bottom",
-                bgcolor="rgba(255,255,255,0.9)",
-                bordercolor="rgba(0,0,0,0.3)",
-                borderwidth=1,
-                font=dict(size=12)
-            ),
-        ],
-        sliders=[dict(
-            active=0,
-            yanchor="top",
-            xanchor="left",
-            currentvalue=dict(
-                font=dict(size=14, color="black"),
-                prefix="Período: ",
-                visible=True,
-                xanchor="center"
-            ),
-            transition=dict(duration=300, easing="cubic-in-out"),
-            pad=dict(b=10, t=40),
-            len=0.8,
-            x=0.1,
-            y=0,
-            steps=[
-                dict(
-                    args=[[period], {"frame": {"duration": 300, "redraw": True},
-                                   "mode": "immediate",
-                                   "transition": {"duration": 300, "easing": "cubic-in-out"}}],
-                    label=period,
-                    method="animate"
-                ) for period in sorted(df_combined_grouped['period_label'].unique())
-            ],
-            bgcolor="rgba(255,255,255,0.9)",
-            bordercolor="rgba(0,0,0,0.3)",
-            borderwidth=1,
-            tickcolor="rgba(0,0,0,0.3)"
-        )]
+        annotations=annotations
     )
-    
+
     return fig_vaccination_map
 
-# Create the charts
-stacked_area_chart = create_stacked_area_chart(df_income_time)
-vaccination_map = create_vaccination_map(df_polio_vaccine)
+# Memoize the serialized figures rather than the Figure objects: Plotly's
+# JSON encoding dominates figure cost, so that is what is worth caching
+@cache.memoize()
+def get_stacked_area_json():
+    """Serialized stacked area figure, built once and cached on disk"""
+    return create_stacked_area_chart(df_income_time).to_json()
+
+@cache.memoize()
+def get_map_data():
+    """Per-period trace arrays for the map, aggregated once and cached"""
+    return prepare_map_data(df_polio_vaccine)
+
+@cache.memoize()
+def get_vaccination_map_json():
+    """Serialized base map figure (first period), built once and cached"""
+    periods, payloads = get_map_data()
+    return create_vaccination_map(payloads[periods[0]]).to_json()
+
+# The map's inputs are fixed, so serialize it once at boot; later workers
+# and requests hit the shared on-disk cache
+get_vaccination_map_json()
 
 # Define app layout
 app.layout = html.Div([
@@ -540,7 +522,7 @@ def render_content(active_tab):
             
             html.Div([
                 dcc.Graph(
-                    figure=stacked_area_chart,
+                    figure=json.loads(get_stacked_area_json()),
                     style={'height': '800px', 'width': '100%'},
                     config={'displayModeBar': True, 'responsive': True}
                 )
@@ -558,24 +540,39 @@ def render_content(active_tab):
         ])
     
     elif active_tab == 'tab-2':
+        periods, _ = get_map_data()
         return html.Div([
-            html.H2("Mapa Global Interactivo: Vacunación vs. Casos", 
+            html.H2("Mapa Global Interactivo: Vacunación vs. Casos",
                     style={'textAlign': 'center', 'marginBottom': 20, 'color': '#2B6387'}),
-            
+
             html.P([
                 "Este mapa animado combina dos visualizaciones: el color de cada país representa el nivel ",
                 "de cobertura de vacunación, mientras que los círculos rojos indican la cantidad ",
                 "de casos de polio por millón de habitantes."
             ], style={'textAlign': 'center', 'marginBottom': 30, 'fontSize': 14, 'color': '#666'}),
-            
+
             html.Div([
                 dcc.Graph(
-                    figure=vaccination_map,
+                    id='vaccination-map',
+                    figure=json.loads(get_vaccination_map_json()),
                     style={'height': '900px', 'width': '100%'},
                     config={'displayModeBar': True, 'responsive': True}
                 )
             ], style={'display': 'flex', 'justifyContent': 'center', 'alignItems': 'center'}),
-            
+
+            html.Div([
+                html.Label("Período:", style={'fontSize': 14, 'color': '#2B6387', 'marginBottom': 10}),
+                dcc.Slider(
+                    id='period-slider',
+                    min=0,
+                    max=len(periods) - 1,
+                    step=1,
+                    value=0,
+                    marks={i: period for i, period in enumerate(periods)},
+                    included=False
+                )
+            ], style={'maxWidth': '1200px', 'margin': '0 auto', 'marginBottom': 30}),
+
             html.Div([
                 html.H3("Cómo Interpretar el Mapa:", style={'color': '#2B6387', 'marginBottom': 10}),
                 html.Ul([
@@ -587,6 +584,32 @@ def render_content(active_tab):
             ], style={'marginTop': 30, 'padding': '20px', 'backgroundColor': '#f8f9fa', 'borderRadius': '8px'})
         ])
 
+@callback(Output('vaccination-map', 'figure'),
+          Input('period-slider', 'value'),
+          prevent_initial_call=True)
+def update_map_period(period_index):
+    """Patch the selected period's trace arrays into the existing figure"""
+    periods, payloads = get_map_data()
+    payload = payloads[periods[period_index]]
+
+    # Sending a Patch ships only the changed arrays, not the whole figure
+    patched = Patch()
+
+    choro = payload['choropleth']
+    patched['data'][0]['locations'] = choro['locations']
+    patched['data'][0]['z'] = choro['z']
+    patched['data'][0]['text'] = choro['text']
+    patched['data'][0]['customdata'] = choro['customdata']
+
+    scatter = payload['scatter']
+    patched['data'][1]['lon'] = scatter['lon']
+    patched['data'][1]['lat'] = scatter['lat']
+    patched['data'][1]['marker']['size'] = scatter['size']
+    patched['data'][1]['hovertext'] = scatter['hovertext']
+    patched['data'][1]['customdata'] = scatter['customdata']
+
+    return patched
+
 # Run the app
 if __name__ == '__main__':
     # Use PORT environment variable for deployment
@@ -0,0 +1,29 @@
+"""One-off conversion of the CSV inputs to Parquet.
+
+Parquet keeps the parsed column types on disk, so the app can scan the
+files directly instead of re-tokenizing CSV on every cold start. Run from
+the repository root after updating any of the CSV exports:
+
+    python scripts/convert_to_parquet.py
+"""
+
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+# source CSV stem -> target Parquet stem, both under data/
+DATASETS = {
+    'number-of-estimated-paralytic-polio-cases-by-world-region': 'polio_cases',
+    'country_metadata': 'country_metadata',
+    'total_population': 'total_population',
+    'global-vaccination-coverage': 'vaccination_coverage',
+}
+
+for source, target in DATASETS.items():
+    table = pacsv.read_csv(
+        f'data/{source}.csv',
+        # empty cells (quoted or not) become nulls, matching the app's
+        # expectations for the metadata export
+        convert_options=pacsv.ConvertOptions(strings_can_be_null=True)
+    )
+    pq.write_table(table, f'data/{target}.parquet', compression='snappy')
+    print(f'data/{target}.parquet: {table.num_rows} rows, {table.num_columns} columns')